@@ -27,18 +27,34 @@ async def main():
     )
     await asyncio.sleep(10)
     # Print the status to observe the evolution
-    # during a minute
-    for _ in range(12):
+    # during a minute, polling less often while
+    # nothing changes
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + 60
+    delay = 5
+    last_status = None
+    while loop.time() < deadline:
         try:
             # By setting raw to True, the returned
             # entry contains a FullStatus object with
             # all the available status data.
             # status = await model.status(raw=True)
             status = await formatted_status(model)
-            print(status)
         except Exception as e:
             print(e)
-        await asyncio.sleep(5)
+        else:
+            # The Model line carries the controller timestamp,
+            # which differs on every call: leave it out when
+            # looking for changes
+            lines = status.splitlines()
+            current_status = lines[:1] + lines[2:]
+            if current_status != last_status:
+                print(status)
+                last_status = current_status
+                delay = 5
+            else:
+                delay = min(delay * 2, 30)
+        await asyncio.sleep(min(delay, deadline - loop.time()))
 
     print("Removing ubuntu")
     await application.remove()
@@ -1298,6 +1298,15 @@ class Model:
         observer = _Observer(callable_, entity_type, action, entity_id, predicate)
         self._observers[observer] = callable_
 
+    def remove_observer(self, callable_):
+        """Unregister the "on-model-change" callbacks for ``callable_``
+
+        See :meth:`add_observer`.
+
+        """
+        for observer in [o for o in self._observers if o.callable_ is callable_]:
+            del self._observers[observer]
+
     def _watch(self):
         """Start an asynchronous watch against this model.
 
@@ -3272,6 +3281,10 @@ class Model:
         """Wait for applications in the model to settle into an idle state.
 
         arguments match those of .wait_for_idle exactly.
+
+        Each poll makes a single FullStatus call: unit, subordinate and machine
+        status for all apps come back in that one response, and _idle.check()
+        must not issue follow-up calls per app.
         """
         if not isinstance(wait_for_exact_units, (int, type(None))):
             raise ValueError(f"Must be an int or None, got {wait_for_exact_units=}")
@@ -3307,26 +3320,56 @@ class Model:
             wait_for_units=wait_for_units,
             idle_period=idle_period,
         )
+        scratch = _idle.CheckStatus(set(), set(), set(), {})
+        changed = asyncio.Event()
 
-        while True:
-            done = loop.next(
-                _idle.check(
-                    await self.get_status(),
-                    apps=apps,
-                    raise_on_error=raise_on_error,
-                    raise_on_blocked=raise_on_blocked,
-                    status=status,
-                )
-            )
+        # Must be a coroutine function: _Observer awaits it
+        async def on_change(delta, old, new, model):  # noqa: RUF029
+            changed.set()
 
-            logger.info(f"wait_for_idle start{time.monotonic() - started:+.1f} {done=}")
-            if done:
-                break
+        # Model deltas only hint that it's worth polling again: FullStatus
+        # remains the source of truth, and absent any delta we still poll
+        # every max(check_freq, idle_period) seconds.
+        self.add_observer(on_change)
+        fallback = max(check_freq, idle_period)
 
-            if deadline and time.monotonic() > deadline:
-                raise asyncio.TimeoutError(f"Timed out after {timeout}s")
+        try:
+            while True:
+                polled = time.monotonic()
+                changed.clear()
+                done = loop.next(
+                    _idle.check(
+                        await self.get_status(),
+                        apps=apps,
+                        raise_on_error=raise_on_error,
+                        raise_on_blocked=raise_on_blocked,
+                        status=status,
+                        scratch=scratch,
+                    )
+                )
 
-            await asyncio.sleep(check_freq)
+                logger.info(
+                    "wait_for_idle start%+.1f done=%s", time.monotonic() - started, done
+                )
+                if done:
+                    break
+
+                if deadline and time.monotonic() > deadline:
+                    raise asyncio.TimeoutError(f"Timed out after {timeout}s")
+
+                wake_in = loop.settle_delay()
+                wake_in = fallback if wake_in is None else min(wake_in, fallback)
+                if deadline:
+                    wake_in = min(wake_in, deadline - time.monotonic())
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=max(wake_in, 0))
+                except asyncio.TimeoutError:
+                    pass
+
+                # Don't poll more often than check_freq, however busy the model is
+                await asyncio.sleep(max(polled + check_freq - time.monotonic(), 0))
+        finally:
+            self.remove_observer(on_change)
 
 
 def _create_consume_args(offer, macaroon, controller_info):
@@ -4,13 +4,15 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-import time
-from dataclasses import dataclass
+import sys
+from time import monotonic_ns
 from typing import AbstractSet
 
 from ..client._definitions import (
     ApplicationStatus,
+    DetailedStatus,
     FullStatus,
     MachineStatus,
     UnitStatus,
@@ -19,10 +21,18 @@ from ..errors import JujuAgentError, JujuAppError, JujuMachineError, JujuUnitErr
 
 logger = logging.getLogger(__name__)
 
+NOT_IDLE = sys.maxsize
+"""idle_since value for units that are not idle; compares above any timestamp."""
+
 
-@dataclass
 class CheckStatus:
-    """Return type check(), represents single loop iteration."""
+    """Return type check(), represents single loop iteration.
+
+    A plain class with __slots__ rather than a dataclass, because
+    dataclass(slots=True) needs Python 3.10 and we still support 3.8.
+    """
+
+    __slots__ = ("idle_units", "ready_by_app", "ready_units", "units")
 
     units: set[str]
     """All units visible at this point."""
@@ -30,6 +40,43 @@ class CheckStatus:
     """Units with the expected workload status."""
     idle_units: set[str]
     """Units with stable (idle) agent status."""
+    ready_by_app: dict[str, int] | None
+    """Count of ready units per app, if known."""
+
+    def __init__(
+        self,
+        units: set[str],
+        ready_units: set[str],
+        idle_units: set[str],
+        ready_by_app: dict[str, int] | None = None,
+    ):
+        self.units = units
+        self.ready_units = ready_units
+        self.idle_units = idle_units
+        self.ready_by_app = ready_by_app
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CheckStatus):
+            return NotImplemented
+        return (
+            self.units == other.units
+            and self.ready_units == other.ready_units
+            and self.idle_units == other.idle_units
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CheckStatus(units={self.units!r}, ready_units={self.ready_units!r}, "
+            f"idle_units={self.idle_units!r})"
+        )
+
+    def reset(self) -> None:
+        """Empty the unit sets in place so that check() can refill them."""
+        self.units.clear()
+        self.ready_units.clear()
+        self.idle_units.clear()
+        if self.ready_by_app is not None:
+            self.ready_by_app.clear()
 
 
 class Loop:
@@ -41,56 +88,99 @@ class Loop:
         wait_for_units: int,
         idle_period: float,
     ):
-        self.apps = apps
+        self.apps = frozenset(apps)
         self.wait_for_exact_units = wait_for_exact_units
         self.wait_for_units = wait_for_units
         self.idle_period = idle_period
-        self.idle_since: dict[str, float] = {}
+        self.idle_period_ns = int(idle_period * 1e9)
+        self.idle_since: dict[str, int] = {}
+        """time.monotonic_ns() since which each unit has been idle."""
+        self._non_idle: set[str] = set()
+        """Units last seen with a non-idle agent status."""
+        self._settling: list[tuple[int, str]] = []
+        """Min-heap of (idle_since, unit) for units that may not have been idle
+        for long enough; entries that no longer match idle_since are stale."""
+        self._prev_idle: AbstractSet[str] = frozenset()
+
+    def settle_delay(self) -> float | None:
+        """Seconds until the next idle unit has been idle for long enough.
+
+        None if no unit is waiting out the idle period.
+        """
+        if not self._settling:
+            return None
+        delay_ns = self._settling[0][0] + self.idle_period_ns - monotonic_ns()
+        return max(delay_ns, 0) / 1e9
 
     def next(self, status: CheckStatus | None) -> bool:
-        logger.info("wait_for_idle iteration %s", status)
-        now = time.monotonic()
+        log_info = logger.info if logger.isEnabledFor(logging.INFO) else None
+        if log_info:
+            log_info("wait_for_idle iteration %s", status)
+        now = monotonic_ns()
 
         if not status:
             return False
 
-        expected_idle_since = now - self.idle_period
-
-        for name in status.units:
-            if name in status.idle_units:
-                self.idle_since[name] = min(
-                    now, self.idle_since.get(name, float("inf"))
-                )
-            else:
-                self.idle_since[name] = float("inf")
-
-        if busy := {n for n, t in self.idle_since.items() if t > expected_idle_since}:
-            logger.info("Waiting for units to be idle enough: %s", busy)
+        expected_idle_since = now - self.idle_period_ns
+
+        idle_units = status.idle_units & status.units
+        for name in idle_units - self._prev_idle:
+            if self.idle_since.get(name, NOT_IDLE) == NOT_IDLE:
+                self.idle_since[name] = now
+                heapq.heappush(self._settling, (now, name))
+            self._non_idle.discard(name)
+        non_idle = status.units - idle_units
+        for name in non_idle:
+            self.idle_since[name] = NOT_IDLE
+        self._non_idle |= non_idle
+        self._prev_idle = idle_units
+
+        # Entries are pushed in time order, so once the top entry is current
+        # and still too recent, any remaining entry is too.
+        settling = self._settling
+        while settling and (
+            settling[0][0] <= expected_idle_since
+            or settling[0][0] != self.idle_since[settling[0][1]]
+        ):
+            heapq.heappop(settling)
+
+        if self._non_idle or settling:
+            if log_info:
+                busy = self._non_idle | {n for _, n in settling}
+                log_info("Waiting for units to be idle enough: %s", busy)
             return False
 
+        ready_by_app = status.ready_by_app
+        if ready_by_app is None:
+            ready_by_app = {}
+            for name in status.ready_units:
+                app_name = name.partition("/")[0]
+                if app_name in self.apps:
+                    ready_by_app[app_name] = ready_by_app.get(app_name, 0) + 1
+
         for app_name in self.apps:
-            ready_units = [
-                n for n in status.ready_units if n.startswith(f"{app_name}/")
-            ]
-            if len(ready_units) < self.wait_for_units:
-                logger.info(
-                    "Waiting for app %r units %s >= %s",
-                    app_name,
-                    len(status.ready_units),
-                    self.wait_for_units,
-                )
+            ready = ready_by_app.get(app_name, 0)
+            if ready < self.wait_for_units:
+                if log_info:
+                    log_info(
+                        "Waiting for app %r units %s >= %s",
+                        app_name,
+                        ready,
+                        self.wait_for_units,
+                    )
                 return False
 
             if (
                 self.wait_for_exact_units is not None
-                and len(ready_units) != self.wait_for_exact_units
+                and ready != self.wait_for_exact_units
             ):
-                logger.info(
-                    "Waiting for app %r units %s == %s",
-                    app_name,
-                    len(ready_units),
-                    self.wait_for_exact_units,
-                )
+                if log_info:
+                    log_info(
+                        "Waiting for app %r units %s == %s",
+                        app_name,
+                        ready,
+                        self.wait_for_exact_units,
+                    )
                 return False
 
         return True
@@ -103,76 +193,108 @@ def check(
     raise_on_error: bool,
     raise_on_blocked: bool,
     status: str | None,
+    scratch: CheckStatus | None = None,
 ) -> CheckStatus | None:
-    """A single iteration of a wait_for_idle loop."""
+    """A single iteration of a wait_for_idle loop.
+
+    If `scratch` is given, it is reset and filled in instead of allocating a
+    new CheckStatus; the caller must not hold on to the previous result.
+    """
     for app_name in apps:
         if not full_status.applications.get(app_name):
             logger.info("Waiting for app %r", app_name)
             return None
 
-    units: dict[str, UnitStatus] = {}
-    rv = CheckStatus(set(), set(), set())
+    rv = CheckStatus(set(), set(), set()) if scratch is None else scratch
+    rv.reset()
+    if rv.ready_by_app is None:
+        rv.ready_by_app = {}
+    ready_by_app = rv.ready_by_app
+    machine_error: tuple[str, UnitStatus, DetailedStatus] | None = None
+    agent_error: tuple[str, DetailedStatus] | None = None
+    workload_error: tuple[str, DetailedStatus] | None = None
+    workload_blocked: tuple[str, DetailedStatus] | None = None
+    # Not kept across polls: any unit's status may change between FullStatus
+    # snapshots, and there is no cheap key that would tell us it did not.
+    subordinates: dict[str, dict[str, dict[str, UnitStatus]]] = {}
 
     for app_name in apps:
-        units.update(app_units(full_status, app_name))
-
-    if raise_on_error:
-        check_errors(full_status, apps, units)
-
-    if raise_on_blocked:
-        check_blocked(full_status, apps, units)
-
-    for app_name in apps:
-        app = full_status.applications[app_name]
-        assert isinstance(app, ApplicationStatus)
+        ready = 0
 
-        for unit_name, unit in app_units(full_status, app_name).items():
+        for unit_name, unit in app_units(full_status, app_name, subordinates).items():
             rv.units.add(unit_name)
-            assert unit.agent_status
-            assert unit.workload_status
+            # A unit in FullStatus always carries both statuses
+            agent: DetailedStatus = unit.agent_status  # pyright: ignore[reportAssignmentType]
+            workload: DetailedStatus = unit.workload_status  # pyright: ignore[reportAssignmentType]
 
-            if unit.agent_status.status == "idle":
+            if agent.status == "idle":
                 rv.idle_units.add(unit_name)
 
-            if not status or unit.workload_status.status == status:
+            if not status or workload.status == status:
                 rv.ready_units.add(unit_name)
+                ready += 1
+
+            # A machine error outranks everything, an agent error outranks
+            # workload errors: stop looking once nothing can outrank the find.
+            if raise_on_error and not machine_error:
+                if unit.machine:
+                    machine = full_status.machines[unit.machine]
+                    assert isinstance(machine, MachineStatus)
+                    assert machine.instance_status
+                    if machine.instance_status.status == "error":
+                        machine_error = (unit_name, unit, machine.instance_status)
+
+                if not agent_error:
+                    if agent.status == "error":
+                        agent_error = (unit_name, agent)
+                    elif not workload_error and workload.status == "error":
+                        workload_error = (unit_name, workload)
+
+            if (
+                raise_on_blocked
+                and not workload_blocked
+                and workload.status == "blocked"
+            ):
+                workload_blocked = (unit_name, workload)
+
+        ready_by_app[app_name] = ready
+
+    if raise_on_error:
+        check_errors(full_status, apps, machine_error, agent_error, workload_error)
+
+    if raise_on_blocked:
+        check_blocked(full_status, apps, workload_blocked)
 
     return rv
 
 
 def check_errors(
-    full_status: FullStatus, apps: AbstractSet[str], units: dict[str, UnitStatus]
+    full_status: FullStatus,
+    apps: AbstractSet[str],
+    machine_error: tuple[str, UnitStatus, DetailedStatus] | None,
+    agent_error: tuple[str, DetailedStatus] | None,
+    workload_error: tuple[str, DetailedStatus] | None,
 ) -> None:
-    """Check the full status for error conditions, in this order:
+    """Raise the first error condition found by check(), in this order:
 
     - Machine error (any unit of any app from apps)
     - Agent error (-"-)
     - Workload error (-"-)
     - App error (any app from apps)
     """
-    for unit_name, unit in units.items():
-        if unit.machine:
-            machine = full_status.machines[unit.machine]
-            assert isinstance(machine, MachineStatus)
-            assert machine.instance_status
-            if machine.instance_status.status == "error":
-                raise JujuMachineError(
-                    f"{unit_name!r} machine {unit.machine!r} has errored: {machine.instance_status.info!r}"
-                )
-
-    for unit_name, unit in units.items():
-        assert unit.agent_status
-        if unit.agent_status.status == "error":
-            raise JujuAgentError(
-                f"{unit_name!r} agent has errored: {unit.agent_status.info!r}"
-            )
-
-    for unit_name, unit in units.items():
-        assert unit.workload_status
-        if unit.workload_status.status == "error":
-            raise JujuUnitError(
-                f"{unit_name!r} workload has errored: {unit.workload_status.info!r}"
-            )
+    if machine_error:
+        unit_name, unit, instance_status = machine_error
+        raise JujuMachineError(
+            f"{unit_name!r} machine {unit.machine!r} has errored: {instance_status.info!r}"
+        )
+
+    if agent_error:
+        unit_name, agent = agent_error
+        raise JujuAgentError(f"{unit_name!r} agent has errored: {agent.info!r}")
+
+    if workload_error:
+        unit_name, workload = workload_error
+        raise JujuUnitError(f"{unit_name!r} workload has errored: {workload.info!r}")
 
     for app_name in apps:
         app = full_status.applications[app_name]
@@ -183,19 +305,18 @@ def check_errors(
 
 
 def check_blocked(
-    full_status: FullStatus, apps: AbstractSet[str], units: dict[str, UnitStatus]
+    full_status: FullStatus,
+    apps: AbstractSet[str],
+    workload_blocked: tuple[str, DetailedStatus] | None,
 ) -> None:
-    """Check the full status for blocked conditions, in this order:
+    """Raise the first blocked condition found by check(), in this order:
 
     - Workload blocked (any unit of any app from apps)
     - App blocked (any app from apps)
     """
-    for unit_name, unit in units.items():
-        assert unit.workload_status
-        if unit.workload_status.status == "blocked":
-            raise JujuUnitError(
-                f"{unit_name!r} workload is blocked: {unit.workload_status.info!r}"
-            )
+    if workload_blocked:
+        unit_name, workload = workload_blocked
+        raise JujuUnitError(f"{unit_name!r} workload is blocked: {workload.info!r}")
 
     for app_name in apps:
         app = full_status.applications[app_name]
@@ -205,26 +326,43 @@ def check_blocked(
             raise JujuAppError(f"{app_name!r} is blocked: {app.status.info!r}")
 
 
-def app_units(full_status: FullStatus, app_name: str) -> dict[str, UnitStatus]:
-    """Fish out the app's units' status from a FullStatus response."""
+def app_units(
+    full_status: FullStatus,
+    app_name: str,
+    subordinates: dict[str, dict[str, dict[str, UnitStatus]]] | None = None,
+) -> dict[str, UnitStatus]:
+    """Fish out the app's units' status from a FullStatus response.
+
+    Pass the same `subordinates` dict for all apps of a single FullStatus to
+    index each parent app's subordinate units only once.
+    """
     rv: dict[str, UnitStatus] = {}
     app = full_status.applications[app_name]
     assert isinstance(app, ApplicationStatus)
 
     if app.subordinate_to:
-        parent_name = app.subordinate_to[0]
-        parent = full_status.applications[parent_name]
-        assert isinstance(parent, ApplicationStatus)
-        for parent_unit in parent.units.values():
-            assert isinstance(parent_unit, UnitStatus)
-            for name, unit in parent_unit.subordinates.items():
-                if not name.startswith(f"{app_name}/"):
-                    continue
-                assert isinstance(unit, UnitStatus)
-                rv[name] = unit
+        parent_name = str(app.subordinate_to[0])
+        if subordinates is None:
+            subordinates = {}
+        if parent_name not in subordinates:
+            subordinates[parent_name] = subordinates_by_app(full_status, parent_name)
+        rv.update(subordinates[parent_name].get(app_name, {}))
     else:
-        for name, unit in app.units.items():
-            assert isinstance(unit, UnitStatus)
-            rv[name] = unit
+        rv.update(app.units)
+
+    return rv
 
+
+def subordinates_by_app(
+    full_status: FullStatus, parent_name: str
+) -> dict[str, dict[str, UnitStatus]]:
+    """Group the subordinate units of the parent app's units by app name."""
+    rv: dict[str, dict[str, UnitStatus]] = {}
+    parent = full_status.applications[parent_name]
+    assert isinstance(parent, ApplicationStatus)
+    for parent_unit in parent.units.values():
+        assert isinstance(parent_unit, UnitStatus)
+        for name, unit in parent_unit.subordinates.items():
+            assert isinstance(unit, UnitStatus)
+            rv.setdefault(name.partition("/")[0], {})[name] = unit
     return rv
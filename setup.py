@@ -40,7 +40,6 @@ setup(
             "pytest",
             "pytest-asyncio <= 0.25.0",  # https://github.com/pytest-dev/pytest-asyncio/issues/1039
             "Twine",
-            "freezegun",
         ]
     },
     include_package_data=True,
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import copy
-import json
 from typing import Any
 
 import pytest
 
-from juju.client._definitions import FullStatus
-from juju.client.facade import _convert_response
+from juju.client._definitions import (
+    DetailedStatus,
+    FullStatus,
+    MachineStatus,
+    UnitStatus,
+)
 from juju.errors import JujuAgentError, JujuAppError, JujuMachineError, JujuUnitError
 from juju.model._idle import CheckStatus, check
 
+from ..utils import UNIT_TEST_DIR, convert, fast_clone, load_json
+
 
 def test_check_status(full_status: FullStatus, kwargs):
     status = check(full_status, **kwargs)
@@ -49,6 +54,15 @@ def test_missing_app(full_status: FullStatus, kwargs):
     assert status is None
 
 
+def test_check_status_reuses_scratch(full_status: FullStatus, kwargs):
+    scratch = CheckStatus({"stale/0"}, {"stale/0"}, {"stale/0"}, {"stale": 1})
+    kwargs["apps"] = ["hexanator"]
+    status = check(full_status, scratch=scratch, **kwargs)
+    assert status is scratch
+    assert scratch == CheckStatus({"hexanator/0"}, {"hexanator/0"}, {"hexanator/0"})
+    assert scratch.ready_by_app == {"hexanator": 1}
+
+
 def test_no_units(response: dict[str, Any], kwargs):
     response["response"]["applications"]["hexanator"]["units"].clear()
     kwargs["apps"] = ["hexanator"]
@@ -56,20 +70,6 @@ def test_no_units(response: dict[str, Any], kwargs):
     assert status == CheckStatus(set(), set(), set())
 
 
-def test_app_error(response: dict[str, Any], kwargs):
-    app = response["response"]["applications"]["hexanator"]
-    app["status"]["status"] = "error"
-    app["status"]["info"] = "big problem"
-
-    kwargs["apps"] = ["hexanator"]
-    kwargs["raise_on_error"] = True
-
-    with pytest.raises(JujuAppError) as e:
-        check(convert(response), **kwargs)
-
-    assert "big problem" in str(e)
-
-
 def test_ready_units(full_status: FullStatus, kwargs):
     kwargs["apps"] = ["mysql-test-app"]
     status = check(full_status, **kwargs)
@@ -83,12 +83,19 @@ def test_active_units(full_status: FullStatus, kwargs):
     status = check(full_status, **kwargs)
     units = {"mysql-test-app/0", "mysql-test-app/1"}
     assert status == CheckStatus(units, ready_units=set(), idle_units=units)
+    assert status
+    assert status.ready_by_app == {"mysql-test-app": 0}
 
 
-def test_ready_unit_requires_idle_agent(response: dict[str, Any], kwargs):
+def test_ready_unit_requires_idle_agent(
+    response: dict[str, Any], kwargs, _hexanator_unit_template: dict[str, Any]
+):
+    unit = _hexanator_unit_template
     app = response["response"]["applications"]["hexanator"]
-    app["units"]["hexanator/1"] = copy.deepcopy(app["units"]["hexanator/0"])
-    app["units"]["hexanator/1"]["agent-status"]["status"] = "some-other"
+    app["units"]["hexanator/1"] = {
+        **unit,
+        "agent-status": {**unit["agent-status"], "status": "some-other"},
+    }
 
     kwargs["apps"] = ["hexanator"]
     kwargs["status"] = "active"
@@ -101,10 +108,15 @@ def test_ready_unit_requires_idle_agent(response: dict[str, Any], kwargs):
     )
 
 
-def test_ready_unit_requires_workload_status(response: dict[str, Any], kwargs):
+def test_ready_unit_requires_workload_status(
+    response: dict[str, Any], kwargs, _hexanator_unit_template: dict[str, Any]
+):
+    unit = _hexanator_unit_template
     app = response["response"]["applications"]["hexanator"]
-    app["units"]["hexanator/1"] = copy.deepcopy(app["units"]["hexanator/0"])
-    app["units"]["hexanator/1"]["workload-status"]["status"] = "some-other"
+    app["units"]["hexanator/1"] = {
+        **unit,
+        "workload-status": {**unit["workload-status"], "status": "some-other"},
+    }
 
     kwargs["apps"] = ["hexanator"]
     kwargs["status"] = "active"
@@ -112,61 +124,39 @@ def test_ready_unit_requires_workload_status(response: dict[str, Any], kwargs):
     status = check(convert(response), **kwargs)
     units = {"hexanator/0", "hexanator/1"}
     assert status == CheckStatus(units, ready_units={"hexanator/0"}, idle_units=units)
+    assert status
+    assert status.ready_by_app == {"hexanator": 1}
 
 
-def test_agent_error(response: dict[str, Any], kwargs):
-    app = response["response"]["applications"]["hexanator"]
-    app["units"]["hexanator/0"]["agent-status"]["status"] = "error"
-    app["units"]["hexanator/0"]["agent-status"]["info"] = "agent problem"
-
-    kwargs["apps"] = ["hexanator"]
-    kwargs["raise_on_error"] = True
-
-    with pytest.raises(JujuAgentError) as e:
-        check(convert(response), **kwargs)
-
-    assert "hexanator/0" in str(e)
-    assert "agent problem" in str(e)
-
-
-def test_workload_error(response: dict[str, Any], kwargs):
-    app = response["response"]["applications"]["hexanator"]
-    app["units"]["hexanator/0"]["workload-status"]["status"] = "error"
-    app["units"]["hexanator/0"]["workload-status"]["info"] = "workload problem"
-
-    kwargs["apps"] = ["hexanator"]
-    kwargs["raise_on_error"] = True
-
-    with pytest.raises(JujuUnitError) as e:
-        check(convert(response), **kwargs)
-
-    assert "hexanator/0" in str(e)
-    assert "workload problem" in str(e)
+def _hexanator_unit(status: FullStatus) -> UnitStatus:
+    app = status.applications["hexanator"]
+    assert app
+    unit = app.units["hexanator/0"]
+    assert unit
+    return unit
 
 
-def test_machine_ok(response: dict[str, Any], kwargs):
-    app = response["response"]["applications"]["hexanator"]
-    app["units"]["hexanator/0"]["machine"] = "42"
+def test_machine_ok(hexanator_status: FullStatus, kwargs):
+    _hexanator_unit(hexanator_status).machine = "42"
     # https://github.com/dimaqq/juju-schema-analysis/blob/main/schemas-juju-3.5.4.model-user.txt#L3611-L3674
-    response["response"]["machines"] = {
-        "42": {
-            "instance-status": {
-                "status": "running",
-                "info": "RUNNING",
-            },
-        },
+    machines: dict[str, MachineStatus | None] = {
+        "42": MachineStatus(
+            instance_status=DetailedStatus(status="running", info="RUNNING")
+        ),
     }
+    hexanator_status.machines = machines
 
     kwargs["apps"] = ["hexanator"]
     kwargs["raise_on_error"] = True
 
-    status = check(convert(response), **kwargs)
+    status = check(hexanator_status, **kwargs)
     assert status == CheckStatus({"hexanator/0"}, {"hexanator/0"}, {"hexanator/0"})
 
 
-def test_machine_error(response: dict[str, Any], kwargs):
-    app = response["response"]["applications"]["hexanator"]
-    app["units"]["hexanator/0"]["machine"] = "42"
+def test_machine_error_before_agent_error(response: dict[str, Any], kwargs):
+    units = response["response"]["applications"]["mysql-test-app"]["units"]
+    units["mysql-test-app/0"]["agent-status"]["status"] = "error"
+    units["mysql-test-app/1"]["machine"] = "42"
     response["response"]["machines"] = {
         "42": {
             "instance-status": {
@@ -176,62 +166,103 @@ def test_machine_error(response: dict[str, Any], kwargs):
         },
     }
 
-    kwargs["apps"] = ["hexanator"]
+    kwargs["apps"] = ["mysql-test-app"]
     kwargs["raise_on_error"] = True
 
     with pytest.raises(JujuMachineError) as e:
         check(convert(response), **kwargs)
 
-    assert "potato" in str(e)
+    assert "mysql-test-app/1" in str(e)
 
 
-def test_app_blocked(response: dict[str, Any], kwargs):
-    app = response["response"]["applications"]["hexanator"]
-    app["status"]["status"] = "blocked"
-    app["status"]["info"] = "big problem"
+def test_agent_error_before_workload_error(response: dict[str, Any], kwargs):
+    units = response["response"]["applications"]["mysql-test-app"]["units"]
+    units["mysql-test-app/0"]["workload-status"]["status"] = "error"
+    units["mysql-test-app/1"]["agent-status"]["status"] = "error"
 
-    kwargs["apps"] = ["hexanator"]
-    kwargs["raise_on_blocked"] = True
+    kwargs["apps"] = ["mysql-test-app"]
+    kwargs["raise_on_error"] = True
 
-    with pytest.raises(JujuAppError) as e:
+    with pytest.raises(JujuAgentError) as e:
         check(convert(response), **kwargs)
 
-    assert "big problem" in str(e)
+    assert "mysql-test-app/1" in str(e)
 
 
-def test_unit_blocked(response: dict[str, Any], kwargs):
-    app = response["response"]["applications"]["hexanator"]
-    app["units"]["hexanator/0"]["workload-status"]["status"] = "blocked"
-    app["units"]["hexanator/0"]["workload-status"]["info"] = "small problem"
+def _app_status(status: FullStatus) -> DetailedStatus:
+    app = status.applications["hexanator"]
+    assert app and app.status
+    return app.status
+
+
+def _agent_status(status: FullStatus) -> DetailedStatus:
+    unit = _hexanator_unit(status)
+    assert unit.agent_status
+    return unit.agent_status
+
+
+def _workload_status(status: FullStatus) -> DetailedStatus:
+    unit = _hexanator_unit(status)
+    assert unit.workload_status
+    return unit.workload_status
+
+
+def _machine_status(status: FullStatus) -> DetailedStatus:
+    _hexanator_unit(status).machine = "42"
+    instance_status = DetailedStatus()
+    machines: dict[str, MachineStatus | None] = {
+        "42": MachineStatus(instance_status=instance_status)
+    }
+    status.machines = machines
+    return instance_status
+
+
+@pytest.mark.parametrize(
+    "target, value, flag, exc_type, culprit",
+    [
+        (_app_status, "error", "raise_on_error", JujuAppError, "hexanator"),
+        (_agent_status, "error", "raise_on_error", JujuAgentError, "hexanator/0"),
+        (_workload_status, "error", "raise_on_error", JujuUnitError, "hexanator/0"),
+        (_machine_status, "error", "raise_on_error", JujuMachineError, "hexanator/0"),
+        (_app_status, "blocked", "raise_on_blocked", JujuAppError, "hexanator"),
+        (_workload_status, "blocked", "raise_on_blocked", JujuUnitError, "hexanator/0"),
+    ],
+)
+def test_raises(
+    hexanator_status: FullStatus, kwargs, target, value, flag, exc_type, culprit
+):
+    detailed = target(hexanator_status)
+    detailed.status = value
+    detailed.info = "Battery low. Try a potato?"
 
     kwargs["apps"] = ["hexanator"]
-    kwargs["raise_on_blocked"] = True
+    kwargs[flag] = True
 
-    with pytest.raises(JujuUnitError) as e:
-        check(convert(response), **kwargs)
+    with pytest.raises(exc_type) as e:
+        check(hexanator_status, **kwargs)
 
-    assert "small problem" in str(e)
+    assert repr(culprit) in str(e.value)
+    assert "potato" in str(e.value)
 
 
-def test_no_raise_on(response: dict[str, Any], kwargs):
-    app = response["response"]["applications"]["hexanator"]
-    app["units"]["hexanator/0"]["workload-status"]["status"] = "blocked"
-    app["units"]["hexanator/0"]["workload-status"]["info"] = "small problem"
-    app["units"]["hexanator/0"]["machine"] = "42"
-    response["response"]["machines"] = {
-        "42": {
-            "instance-status": {
-                "status": "running",
-                "info": "RUNNING",
-            },
-        },
+def test_no_raise_on(hexanator_status: FullStatus, kwargs):
+    unit = _hexanator_unit(hexanator_status)
+    assert unit.workload_status
+    unit.workload_status.status = "blocked"
+    unit.workload_status.info = "small problem"
+    unit.machine = "42"
+    machines: dict[str, MachineStatus | None] = {
+        "42": MachineStatus(
+            instance_status=DetailedStatus(status="running", info="RUNNING")
+        ),
     }
+    hexanator_status.machines = machines
 
     kwargs["apps"] = ["hexanator"]
     kwargs["raise_on_blocked"] = False
     kwargs["raise_on_error"] = False
 
-    status = check(convert(response), **kwargs)
+    status = check(hexanator_status, **kwargs)
     assert status  # didn't raise an exception
 
 
@@ -248,27 +279,58 @@ def test_maintenance(response: dict[str, Any], kwargs):
     assert status == CheckStatus({"hexanator/0"}, {"hexanator/0"}, {"hexanator/0"})
 
 
+@pytest.fixture(scope="module")
+def _kwargs_template() -> dict[str, Any]:
+    return {
+        "apps": ("hexanator", "grafana-agent-k8s", "mysql-test-app"),
+        "raise_on_error": False,
+        "raise_on_blocked": False,
+        "status": None,
+    }
+
+
 @pytest.fixture
-def kwargs() -> dict[str, Any]:
-    return dict(
-        apps=["hexanator", "grafana-agent-k8s", "mysql-test-app"],
-        raise_on_error=False,
-        raise_on_blocked=False,
-        status=None,
-    )
+def kwargs(_kwargs_template: dict[str, Any]) -> dict[str, Any]:
+    return dict(_kwargs_template)
+
+
+@pytest.fixture(scope="session")
+def _response_template() -> dict[str, Any]:
+    return load_json(UNIT_TEST_DIR / "data" / "fullstatus.json")
 
 
 @pytest.fixture
-def response(pytestconfig: pytest.Config) -> dict[str, Any]:
-    return json.loads(
-        (pytestconfig.rootpath / "tests/unit/data/fullstatus.json").read_text()
-    )
+def response(_response_template: dict[str, Any]) -> dict[str, Any]:
+    """A private copy of the FullStatus response, for tests that modify it."""
+    return fast_clone(_response_template)
+
+
+@pytest.fixture(scope="session")
+def _hexanator_unit_template(_response_template: dict[str, Any]) -> dict[str, Any]:
+    """The "hexanator/0" unit; build variants with a shallow dict merge."""
+    app = _response_template["response"]["applications"]["hexanator"]
+    return fast_clone(app["units"]["hexanator/0"])
 
 
-def convert(data: dict[str, Any]) -> FullStatus:
-    return _convert_response(data, cls=FullStatus)
+@pytest.fixture(scope="session")
+def full_status(_response_template: dict[str, Any]) -> FullStatus:
+    """Shared across tests, must not be modified."""
+    return convert(_response_template)
 
 
 @pytest.fixture
-def full_status(response) -> FullStatus:
-    return convert(response)
+def hexanator_status(full_status: FullStatus) -> FullStatus:
+    """A cheap copy of full_status where the "hexanator" app, its "hexanator/0"
+    unit and their statuses may be modified; everything else is shared.
+    """
+    app = copy.copy(full_status.applications["hexanator"])
+    assert app and app.status
+    app.status = copy.copy(app.status)
+    unit = copy.copy(app.units["hexanator/0"])
+    assert unit and unit.agent_status and unit.workload_status
+    unit.agent_status = copy.copy(unit.agent_status)
+    unit.workload_status = copy.copy(unit.workload_status)
+    app.units = {**app.units, "hexanator/0": unit}
+    rv = copy.copy(full_status)
+    rv.applications = {**full_status.applications, "hexanator": app}
+    return rv
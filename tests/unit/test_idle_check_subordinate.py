@@ -2,18 +2,19 @@
 # Licensed under the Apache V2, see LICENCE file for details.
 from __future__ import annotations
 
-import json
+import copy
 from typing import Any
 
 import pytest
 
 from juju.client._definitions import FullStatus
-from juju.client.facade import _convert_response
 from juju.model._idle import CheckStatus, check
 
+from ..utils import UNIT_TEST_DIR, convert, load_json
 
-def test_subordinate_apps(response: dict[str, Any], kwargs):
-    status = check(convert(response), **kwargs)
+
+def test_subordinate_apps(subordinate_status: FullStatus, kwargs):
+    status = check(subordinate_status, **kwargs)
     assert status == CheckStatus(
         {"ntp/0", "ubuntu/0"},
         {"ntp/0", "ubuntu/0"},
@@ -21,12 +22,20 @@ def test_subordinate_apps(response: dict[str, Any], kwargs):
     )
 
 
-def test_subordinate_is_selective(response, kwargs):
-    subordinates = response["response"]["applications"]["ubuntu"]["units"]["ubuntu/0"][
-        "subordinates"
-    ]
-    subordinates["some-other/0"] = subordinates["ntp/0"]
-    status = check(convert(response), **kwargs)
+def test_subordinate_is_selective(subordinate_status: FullStatus, kwargs):
+    app = copy.copy(subordinate_status.applications["ubuntu"])
+    assert app
+    unit = copy.copy(app.units["ubuntu/0"])
+    assert unit and unit.subordinates
+    unit.subordinates = {
+        **unit.subordinates,
+        "some-other/0": unit.subordinates["ntp/0"],
+    }
+    app.units = {**app.units, "ubuntu/0": unit}
+    full_status = copy.copy(subordinate_status)
+    full_status.applications = {**subordinate_status.applications, "ubuntu": app}
+
+    status = check(full_status, **kwargs)
     assert status == CheckStatus(
         {"ntp/0", "ubuntu/0"},
         {"ntp/0", "ubuntu/0"},
@@ -34,30 +43,27 @@ def test_subordinate_is_selective(response, kwargs):
     )
 
 
-@pytest.fixture
-def kwargs() -> dict[str, Any]:
-    return dict(
-        apps=["ntp", "ubuntu"],
-        raise_on_error=False,
-        raise_on_blocked=False,
-        status=None,
-    )
+@pytest.fixture(scope="module")
+def _kwargs_template() -> dict[str, Any]:
+    return {
+        "apps": ("ntp", "ubuntu"),
+        "raise_on_error": False,
+        "raise_on_blocked": False,
+        "status": None,
+    }
 
 
 @pytest.fixture
-def response(pytestconfig: pytest.Config) -> dict[str, Any]:
-    """Juju rpc response JSON to a FullStatus call."""
-    return json.loads(
-        (
-            pytestconfig.rootpath / "tests/unit/data/subordinate-fullstatus.json"
-        ).read_text()
-    )
+def kwargs(_kwargs_template: dict[str, Any]) -> dict[str, Any]:
+    return dict(_kwargs_template)
 
 
-@pytest.fixture
-def subordinate_status(response) -> FullStatus:
-    return convert(response)
+@pytest.fixture(scope="session")
+def _response_template() -> dict[str, Any]:
+    return load_json(UNIT_TEST_DIR / "data" / "subordinate-fullstatus.json")
 
 
-def convert(data: dict[str, Any]) -> FullStatus:
-    return _convert_response(data, cls=FullStatus)
+@pytest.fixture(scope="session")
+def subordinate_status(_response_template: dict[str, Any]) -> FullStatus:
+    """Shared across tests, must not be modified."""
+    return convert(_response_template)
@@ -2,15 +2,49 @@
 # Licensed under the Apache V2, see LICENCE file for details.
 from __future__ import annotations
 
-from typing import AbstractSet, Iterable
+from typing import AbstractSet, Sequence
 
-from freezegun import freeze_time
+import pytest
 
 from juju.model._idle import CheckStatus, Loop
 
+_HEX = frozenset({"hexanator/0"})
+
+
+class FakeClock:
+    """Stand-in for time.monotonic_ns(), advanced explicitly by the test."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+    def tick(self, seconds: float) -> None:
+        self.now += int(seconds * 1e9)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("juju.model._idle.monotonic_ns", clock)
+    return clock
+
+
+@pytest.fixture
+def good() -> CheckStatus:
+    """The hexanator unit is ready and idle."""
+    return CheckStatus(set(_HEX), set(_HEX), set(_HEX))
+
+
+@pytest.fixture
+def bad() -> CheckStatus:
+    """The hexanator unit is ready but not idle."""
+    return CheckStatus(set(_HEX), set(_HEX), set())
+
 
 def unroll(
-    statuses: Iterable[CheckStatus | None],
+    statuses: Sequence[CheckStatus | None],
     *,
     apps: AbstractSet[str],
     wait_for_exact_units: int | None = None,
@@ -26,13 +60,32 @@ def unroll(
     return [loop.next(s) for s in statuses]
 
 
-def test_wait_for_apps():
-    def checks():
-        yield None
-        yield None
+def unroll_timed(
+    clock: FakeClock,
+    pairs: Sequence[tuple[CheckStatus | None, float]],
+    *,
+    apps: AbstractSet[str],
+    wait_for_exact_units: int | None = None,
+    wait_for_units: int,
+    idle_period: float,
+) -> list[bool]:
+    """Like unroll(), advancing the clock by the paired seconds after each status."""
+    loop = Loop(
+        apps=apps,
+        wait_for_exact_units=wait_for_exact_units,
+        wait_for_units=wait_for_units,
+        idle_period=idle_period,
+    )
+    rv: list[bool] = []
+    for status, seconds in pairs:
+        rv.append(loop.next(status))
+        clock.tick(seconds)
+    return rv
 
+
+def test_wait_for_apps():
     assert unroll(
-        checks(),
+        [None, None],
         apps={"a"},
         wait_for_units=0,
         idle_period=0,
@@ -40,19 +93,19 @@ def test_wait_for_apps():
 
 
 def test_at_least_units():
-    def checks():
-        units = {"u/0", "u/1", "u/2"}
-        yield CheckStatus(units, ready_units={"u/0"}, idle_units=units)
-        yield CheckStatus(units, ready_units={"u/0", "u/1"}, idle_units=units)
-        yield CheckStatus(units, ready_units={"u/0", "u/1", "u/2"}, idle_units=units)
+    units = {"u/0", "u/1", "u/2"}
+    statuses = [
+        CheckStatus(units, ready_units={"u/0"}, idle_units=units),
+        CheckStatus(units, ready_units={"u/0", "u/1"}, idle_units=units),
+        CheckStatus(units, ready_units={"u/0", "u/1", "u/2"}, idle_units=units),
+    ]
 
-    with freeze_time():
-        assert unroll(
-            checks(),
-            apps={"u"},
-            wait_for_units=2,
-            idle_period=0,
-        ) == [False, True, True]
+    assert unroll(
+        statuses,
+        apps={"u"},
+        wait_for_units=2,
+        idle_period=0,
+    ) == [False, True, True]
 
 
 def test_for_exact_units():
@@ -61,14 +114,8 @@ def test_for_exact_units():
     too_few = CheckStatus(units, ready_units={"u/2"}, idle_units=units)
     too_many = CheckStatus(units, ready_units={"u/1", "u/2", "u/0"}, idle_units=units)
 
-    def checks():
-        yield too_few
-        yield good
-        yield too_many
-        yield good
-
     assert unroll(
-        checks(),
+        [too_few, good, too_many, good],
         apps={"u"},
         wait_for_units=1,
         wait_for_exact_units=2,
@@ -76,34 +123,49 @@ def test_for_exact_units():
     ) == [False, True, False, True]
 
 
-def test_idle_ping_pong():
-    good = CheckStatus({"hexanator/0"}, {"hexanator/0"}, idle_units={"hexanator/0"})
-    bad = CheckStatus({"hexanator/0"}, {"hexanator/0"}, idle_units=set())
-
-    def checks():
-        with freeze_time() as clock:
-            for status in [good, bad, good, bad]:
-                yield status
-                clock.tick(10)
-
-    assert unroll(
-        checks(),
+def test_idle_ping_pong(clock: FakeClock, good: CheckStatus, bad: CheckStatus):
+    assert unroll_timed(
+        clock,
+        [(good, 10), (bad, 10), (good, 10), (bad, 10)],
         apps={"hexanator"},
         wait_for_units=1,
         idle_period=15,
     ) == [False, False, False, False]
 
 
-def test_idle_period():
-    def checks():
-        with freeze_time() as clock:
-            for _ in range(4):
-                yield CheckStatus({"hexanator/0"}, {"hexanator/0"}, {"hexanator/0"})
-                clock.tick(10)
-
-    assert unroll(
-        checks(),
+def test_idle_period(clock: FakeClock, good: CheckStatus):
+    assert unroll_timed(
+        clock,
+        [(good, 10)] * 4,
         apps={"hexanator"},
         wait_for_units=1,
         idle_period=15,
     ) == [False, False, True, True]
+
+
+def test_at_least_units_per_app():
+    units = {"a/0", "a/1", "b/0"}
+    one_app = CheckStatus(units, ready_units={"a/0", "a/1"}, idle_units=units)
+    both_apps = CheckStatus(units, ready_units={"a/0", "b/0"}, idle_units=units)
+
+    assert unroll(
+        [one_app, both_apps],
+        apps={"a", "b"},
+        wait_for_units=1,
+        idle_period=0,
+    ) == [False, True]
+
+
+def test_settle_delay(clock: FakeClock, good: CheckStatus, bad: CheckStatus):
+    loop = Loop(apps={"hexanator"}, wait_for_units=1, idle_period=15)
+
+    assert loop.settle_delay() is None
+    loop.next(bad)
+    assert loop.settle_delay() is None
+    loop.next(good)
+    clock.tick(10)
+    assert loop.settle_delay() == 5
+    clock.tick(10)
+    assert loop.settle_delay() == 0
+    assert loop.next(good)
+    assert loop.settle_delay() is None
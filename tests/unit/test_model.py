@@ -3,6 +3,8 @@
 
 import asyncio
 import datetime
+import sys
+import time
 import unittest
 from unittest import mock
 from unittest.mock import PropertyMock, patch
@@ -402,3 +404,89 @@ class TestModelWaitForIdle(unittest.IsolatedAsyncioTestCase):
             )
 
         mock_apps.assert_called_with()
+
+
+class _FakeIdleLoop:
+    """Stand-in for juju.model._idle.Loop, done after the given number of polls."""
+
+    def __init__(self, polls, settle_delay=None):
+        self.polls = polls
+        self._settle_delay = settle_delay
+
+    def next(self, status):
+        self.polls -= 1
+        return self.polls <= 0
+
+    def settle_delay(self):
+        return self._settle_delay
+
+
+class TestModelNewWaitForIdle(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.polled_at = []
+        patcher = patch("juju.model._idle.check", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _run(self, m, idle_loop, deltas=0, **kwargs):
+        """Run new_wait_for_idle, sending a model delta during each of the
+        first `deltas` polls; return the seconds between polls.
+        """
+
+        async def get_status():
+            self.polled_at.append(time.monotonic())
+            if len(self.polled_at) <= deltas:
+                delta = _make_delta("application", "change", dict(name="foo"))
+                await m._notify_observers(delta, None, None)
+
+        m.get_status = get_status
+        with patch("juju.model._idle.Loop", return_value=idle_loop):
+            await asyncio.wait_for(
+                m.new_wait_for_idle(apps=["foo"], **kwargs), timeout=5
+            )
+        return [b - a for a, b in zip(self.polled_at, self.polled_at[1:])]
+
+    async def test_delta_wakes_up(self):
+        m = Model()
+        gaps = await self._run(
+            m, _FakeIdleLoop(2), deltas=1, idle_period=30, check_freq=0
+        )
+        self.assertLess(gaps[0], 1)
+
+    async def test_fallback(self):
+        m = Model()
+        gaps = await self._run(m, _FakeIdleLoop(2), idle_period=0.2, check_freq=0)
+        self.assertGreaterEqual(gaps[0], 0.2)
+
+    async def test_settle_delay(self):
+        m = Model()
+        gaps = await self._run(
+            m, _FakeIdleLoop(2, settle_delay=0), idle_period=30, check_freq=0
+        )
+        self.assertLess(gaps[0], 1)
+
+    async def test_check_freq_floor(self):
+        m = Model()
+        gaps = await self._run(
+            m, _FakeIdleLoop(3), deltas=2, idle_period=30, check_freq=0.2
+        )
+        self.assertEqual(len(gaps), 2)
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 0.2)
+
+    async def test_deadline(self):
+        m = Model()
+        started = time.monotonic()
+        with self.assertRaises(asyncio.TimeoutError) as cm:
+            await self._run(m, _FakeIdleLoop(sys.maxsize), idle_period=30, timeout=0.2)
+        self.assertEqual(str(cm.exception), "Timed out after 0.2s")
+        self.assertLess(time.monotonic() - started, 1)
+
+    async def test_removes_observer(self):
+        m = Model()
+        await self._run(m, _FakeIdleLoop(2), deltas=1, idle_period=30, check_freq=0)
+        self.assertEqual(len(m._observers), 0)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self._run(m, _FakeIdleLoop(sys.maxsize), timeout=0)
+        self.assertEqual(len(m._observers), 0)